@@ -1,11 +1,23 @@
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
+def format_utc_epoch(epoch: int) -> str:
+    """
+    Format UTC epoch seconds as an ISO-8601 string with 'Z' suffix,
+    without building a datetime object.
+    """
+    t = time.gmtime(epoch)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
+
 def current_utc_iso() -> str:
     """
     Return the current UTC time as an ISO-8601 string with 'Z' suffix.
     """
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return format_utc_epoch(int(time.time()))
 
 def parse_iso_datetime(value: str) -> Optional[datetime]:
     """
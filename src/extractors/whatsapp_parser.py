@@ -1,9 +1,18 @@
 import hashlib
 import logging
-import re
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional accelerator
+    np = None
+
+from extractors.utils_time import format_utc_epoch
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +26,26 @@ class WhatsAppProfile:
     account_type: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # A flat literal avoids asdict()'s recursive copy.
+        return {
+            "number": self.number,
+            "is_registered": self.is_registered,
+            "profile_picture": self.profile_picture,
+            "about": self.about,
+            "about_last_updated": self.about_last_updated,
+            "account_type": self.account_type,
+        }
+
+# Column order of every profile dict produced by build_profiles.
+WHATSAPP_FIELDS = tuple(field.name for field in fields(WhatsAppProfile))
+
+# Profiles only need 8 digest bytes for their fields and 8 for the picture id.
+_DIGEST_SIZE = 16
+
+# Below this many numbers per worker, process start-up costs more than it saves.
+# Only the pure-Python path is parallelized: with NumPy, pickling the result
+# dicts back to the parent costs about as much as building them.
+_MIN_CHUNK_SIZE = 10_000
 
 ABOUT_TEMPLATES = [
     "Living my best life!",
@@ -30,66 +58,92 @@ ABOUT_TEMPLATES = [
     "Blessed and grateful.",
 ]
 
-def _validate_number(raw: str) -> str:
+def strip_number(raw: bytes) -> bytes:
+    """
+    Strip surrounding whitespace from a raw phone number line.
+
+    bytes.strip() only removes ASCII whitespace, so lines containing other
+    bytes are decoded and stripped as text to also drop Unicode whitespace
+    such as a trailing non-breaking space.
+    """
     cleaned = raw.strip()
+    if cleaned.isascii():
+        return cleaned
+    return raw.decode("utf-8", "replace").strip().encode("utf-8")
+
+def _validate_number(raw: bytes) -> bytes:
+    cleaned = strip_number(raw)
     if not cleaned:
         raise ValueError("Phone number is empty.")
-    if not re.fullmatch(r"\d+", cleaned):
-        raise ValueError(f"Invalid phone number '{raw}'. Only digits are allowed.")
-    if len(cleaned) < 6:
-        raise ValueError(f"Phone number '{raw}' is too short to be valid.")
-    if len(cleaned) > 20:
-        raise ValueError(f"Phone number '{raw}' is too long to be valid.")
+    # bytes.isdigit() only accepts ASCII digits.
+    if not cleaned.isdigit():
+        shown = raw.decode("utf-8", "replace")
+        raise ValueError(f"Invalid phone number '{shown}'. Only digits are allowed.")
+    length = len(cleaned)
+    if not 6 <= length <= 20:
+        reason = "short" if length < 6 else "long"
+        shown = raw.decode("utf-8", "replace")
+        raise ValueError(f"Phone number '{shown}' is too {reason} to be valid.")
     return cleaned
 
-def _hash_number(number: str) -> str:
-    return hashlib.sha256(number.encode("utf-8")).hexdigest()
+def _hash_numbers_batch(numbers: List[bytes]) -> List[bytes]:
+    """
+    Hash a batch of validated numbers and return the raw 16-byte digests.
 
-def _deterministic_datetime(hash_hex: str) -> datetime:
+    The hash only seeds pseudo-random demo fields, so a short BLAKE2b digest
+    is used instead of SHA-256. The constructor is bound once so the loop only
+    pays for the digest call itself.
     """
-    Produce a deterministic datetime in the past based on the hash.
+    blake2b = hashlib.blake2b
+    return [blake2b(number, digest_size=_DIGEST_SIZE).digest() for number in numbers]
+
+def _deterministic_epoch(digest: bytes, now: int) -> int:
+    """
+    Produce a deterministic UTC epoch second in the past, relative to `now`, based on the hash.
     """
-    # Use parts of the hash as integers to build a timedelta
-    days_ago = int(hash_hex[0:4], 16) % 365
-    hours = int(hash_hex[4:6], 16) % 24
-    minutes = int(hash_hex[6:8], 16) % 60
+    # Use parts of the digest as integers to build an offset
+    days_ago = int.from_bytes(digest[0:2], "big") % 365
+    hours = digest[2] % 24
+    minutes = digest[3] % 60
 
-    now = datetime.now(timezone.utc)
-    dt = now - timedelta(days=days_ago, hours=hours, minutes=minutes)
-    return dt.replace(microsecond=0)
+    return now - days_ago * 86400 - hours * 3600 - minutes * 60
 
-def _deterministic_choice(hash_hex: str, templates: List[str]) -> str:
-    idx = int(hash_hex[8:12], 16) % len(templates)
+def _deterministic_choice(digest: bytes, templates: List[str]) -> str:
+    idx = int.from_bytes(digest[4:6], "big") % len(templates)
     return templates[idx]
 
-def _build_profile(number: str, media_base_url: str) -> WhatsAppProfile:
+def _build_profile(
+    number: str,
+    digest: bytes,
+    media_base: str,
+    now: int,
+) -> WhatsAppProfile:
     """
     Build a deterministic but realistic-looking profile object from a phone number.
 
     This implementation does NOT connect to WhatsApp. It uses a hash of the number
     to generate stable pseudo-random fields suitable for testing and demos.
+    `number` must already be validated and `digest` is its hash digest.
+    `media_base` is the media URL without a trailing slash and `now` is the
+    shared reference time of the batch in UTC epoch seconds.
     """
-    number_validated = _validate_number(number)
-    h = _hash_number(number_validated)
-
     # Determine registration status: ~2/3 registered
-    is_registered = int(h[12:14], 16) % 3 != 0
+    is_registered = digest[6] % 3 != 0
 
     # Account type: ~1/5 business
-    account_type = "business" if int(h[14:16], 16) % 5 == 0 else "personal"
+    account_type = "business" if digest[7] % 5 == 0 else "personal"
 
     # About text and last updated
-    about = _deterministic_choice(h, ABOUT_TEMPLATES) if is_registered else ""
-    about_dt = _deterministic_datetime(h)
-    about_last_updated = about_dt.isoformat().replace("+00:00", "Z")
+    about = _deterministic_choice(digest, ABOUT_TEMPLATES) if is_registered else ""
+    about_last_updated = format_utc_epoch(_deterministic_epoch(digest, now))
 
     # Profile picture URL
     profile_picture = (
-        f"{media_base_url.rstrip('/')}/{h[:16]}.jpg" if is_registered else ""
+        f"{media_base}/{digest[:8].hex()}.jpg" if is_registered else ""
     )
 
     profile = WhatsAppProfile(
-        number=number_validated,
+        number=number,
         is_registered=is_registered,
         profile_picture=profile_picture,
         about=about,
@@ -98,21 +152,134 @@ def _build_profile(number: str, media_base_url: str) -> WhatsAppProfile:
     )
     return profile
 
+def _build_profiles_vectorized(
+    numbers: List[str],
+    digests: List[bytes],
+    media_base: str,
+    now: int,
+) -> List[Dict[str, Any]]:
+    """
+    Column-wise equivalent of calling _build_profile for every number.
+
+    The digests are viewed as a uint8[N, _DIGEST_SIZE] array and every derived
+    field is computed as a NumPy column; Python objects are only created when
+    the final dicts are assembled.
+    """
+    d = np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(-1, _DIGEST_SIZE)
+
+    days_ago = ((d[:, 0].astype(np.int64) << 8) | d[:, 1]) % 365
+    hours = d[:, 2].astype(np.int64) % 24
+    minutes = d[:, 3].astype(np.int64) % 60
+    about_idx = ((d[:, 4].astype(np.int64) << 8) | d[:, 5]) % len(ABOUT_TEMPLATES)
+    is_registered = d[:, 6] % 3 != 0
+    is_business = d[:, 7] % 5 == 0
+
+    epochs = now - days_ago * 86400 - hours * 3600 - minutes * 60
+    timestamps = np.datetime_as_string(epochs.astype("datetime64[s]"), unit="s")
+
+    pictures = d[:, :8].tobytes().hex()
+
+    return [
+        {
+            "number": number,
+            "is_registered": registered,
+            "profile_picture": f"{media_base}/{pictures[16 * i:16 * i + 16]}.jpg" if registered else "",
+            "about": ABOUT_TEMPLATES[idx] if registered else "",
+            "about_last_updated": f"{ts}Z",
+            "account_type": "business" if business else "personal",
+        }
+        for i, (number, registered, idx, ts, business) in enumerate(
+            zip(
+                numbers,
+                is_registered.tolist(),
+                about_idx.tolist(),
+                timestamps.tolist(),
+                is_business.tolist(),
+            )
+        )
+    ]
+
+def _build_profiles_chunk(
+    numbers: List[bytes],
+    media_base: str,
+    now: int,
+) -> List[Dict[str, Any]]:
+    """
+    Hash and build profiles for one slice of already validated numbers.
+
+    Kept at module level so it can be dispatched to worker processes.
+    """
+    digests = _hash_numbers_batch(numbers)
+    texts = [number.decode("ascii") for number in numbers]
+
+    if np is not None:
+        return _build_profiles_vectorized(texts, digests, media_base, now)
+
+    profiles: List[Dict[str, Any]] = []
+    for number, digest in zip(texts, digests):
+        profile = _build_profile(number, digest, media_base=media_base, now=now)
+        profiles.append(profile.to_dict())
+    return profiles
+
 def build_profiles(
-    numbers: Iterable[str],
+    numbers: Iterable[Union[bytes, str]],
     media_base_url: str = "https://cdn.example.com/whatsapp/avatars",
 ) -> List[Dict[str, Any]]:
     """
     Build WhatsAppProfile objects for an iterable of phone numbers.
 
+    Numbers are processed as ASCII bytes; str inputs are encoded once up front.
     Invalid numbers are logged and skipped instead of aborting the entire batch.
+    Each distinct number is built once; repeated numbers share the same dict.
+    Without NumPy, large inputs are split into contiguous chunks and built in
+    worker processes; the returned list keeps the input order.
     """
-    profiles: List[Dict[str, Any]] = []
+    validated: List[bytes] = []
     for raw in numbers:
         try:
-            profile = _build_profile(raw, media_base_url=media_base_url)
-            profiles.append(profile.to_dict())
+            data = raw.encode("utf-8") if isinstance(raw, str) else raw
+            validated.append(_validate_number(data))
         except Exception as exc:  # noqa: BLE001
-            logger.warning("Skipping number '%s': %s", raw, exc)
+            shown = raw.decode("utf-8", "replace") if isinstance(raw, bytes) else raw
+            logger.warning("Skipping number '%s': %s", shown, exc)
             continue
-    return profiles
\ No newline at end of file
+
+    unique = list(dict.fromkeys(validated))
+    if len(unique) < len(validated):
+        logger.debug(
+            "Deduplicated %d numbers to %d unique (%.1f%% duplicates).",
+            len(validated),
+            len(unique),
+            100.0 * (len(validated) - len(unique)) / len(validated),
+        )
+
+    # One clock read per batch keeps every profile relative to the same instant.
+    now = int(time.time())
+    media_base = media_base_url.rstrip("/")
+
+    n_workers = 1
+    if np is None:
+        n_workers = min(os.cpu_count() or 1, max(1, len(unique) // _MIN_CHUNK_SIZE))
+    if n_workers <= 1:
+        profiles = _build_profiles_chunk(unique, media_base, now)
+    else:
+        chunk_size = -(-len(unique) // n_workers)
+        chunks = [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+        logger.debug("Building %d profiles in %d worker processes.", len(unique), len(chunks))
+
+        profiles = []
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(
+                _build_profiles_chunk,
+                chunks,
+                repeat(media_base),
+                repeat(now),
+            )
+            for chunk_profiles in results:
+                profiles.extend(chunk_profiles)
+
+    if len(unique) == len(validated):
+        return profiles
+
+    by_number = dict(zip(unique, profiles))
+    return [by_number[number] for number in validated]
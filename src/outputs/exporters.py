@@ -2,59 +2,98 @@ import csv
 import json
 import logging
 from html import escape
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional, Sequence
+from xml.sax.saxutils import escape as xml_escape
 
-import xml.etree.ElementTree as ET
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 SUPPORTED_FORMATS = {"json", "csv", "xml", "html", "excel"}
 
+# Large write buffers keep the syscall count low on multi-hundred-MB exports.
+_WRITE_BUFFER_SIZE = 1 << 20
+
 def _ensure_parent_dir(path: Path) -> None:
     if path.parent and not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
 
 def _get_fieldnames(records: Iterable[Dict]) -> List[str]:
-    fieldnames: List[str] = []
-    for record in records:
-        for key in record.keys():
-            if key not in fieldnames:
-                fieldnames.append(key)
-    return fieldnames
+    # Fallback for callers that do not pass a schema; handles heterogeneous records.
+    # Union of all keys in first-seen order, collected in a single C-level pass.
+    return list(dict.fromkeys(chain.from_iterable(records)))
+
+def _dumps_json_bytes(record: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 def export_json(records: List[Dict], output_path: Path) -> None:
+    """
+    Write records as a JSON array, serializing one record per line so the
+    full document is never held in memory. Uses orjson when it is installed.
+    """
     _ensure_parent_dir(output_path)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(records, f, ensure_ascii=False, indent=2)
+    with output_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(b"[\n")
+        for i, record in enumerate(records):
+            if i:
+                f.write(b",\n")
+            f.write(b"  ")
+            f.write(_dumps_json_bytes(record))
+        f.write(b"\n]\n")
     logger.info("JSON export completed: %s", output_path)
 
-def export_csv(records: List[Dict], output_path: Path) -> None:
+def export_csv(
+    records: List[Dict],
+    output_path: Path,
+    fieldnames: Optional[Sequence[str]] = None,
+) -> None:
     _ensure_parent_dir(output_path)
-    fieldnames = _get_fieldnames(records) if records else []
-    with output_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for record in records:
-            writer.writerow(record)
+    if fieldnames is None:
+        fieldnames = _get_fieldnames(records) if records else []
+    with output_path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([record.get(key, "") for key in fieldnames] for record in records)
     logger.info("CSV export completed: %s", output_path)
 
 def export_xml(records: List[Dict], output_path: Path) -> None:
+    """
+    Write records as <profiles><profile>...</profile></profiles>, streaming
+    each profile straight to the file instead of building an element tree.
+    """
     _ensure_parent_dir(output_path)
-    root = ET.Element("profiles")
-    for record in records:
-        item = ET.SubElement(root, "profile")
-        for key, value in record.items():
-            child = ET.SubElement(item, key)
-            child.text = "" if value is None else str(value)
-
-    tree = ET.ElementTree(root)
-    tree.write(output_path, encoding="utf-8", xml_declaration=True)
+    with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<profiles>')
+        for record in records:
+            parts = ["<profile>"]
+            for key, value in record.items():
+                text = "" if value is None else xml_escape(str(value))
+                parts.append(f"<{key}>{text}</{key}>")
+            parts.append("</profile>")
+            f.write("".join(parts))
+        f.write("</profiles>\n")
     logger.info("XML export completed: %s", output_path)
 
-def export_html(records: List[Dict], output_path: Path) -> None:
+def export_html(
+    records: List[Dict],
+    output_path: Path,
+    fieldnames: Optional[Sequence[str]] = None,
+) -> None:
+    """
+    Write records as an HTML table. The page header is written once and each
+    record is rendered from a precomputed row template and streamed to the file.
+    """
     _ensure_parent_dir(output_path)
-    if records:
+    if fieldnames is not None:
+        headers = list(fieldnames)
+    elif records:
         headers = list(records[0].keys())
     else:
         headers = []
@@ -82,24 +121,24 @@ def export_html(records: List[Dict], output_path: Path) -> None:
     lines.append("      </tr>")
     lines.append("    </thead>")
     lines.append("    <tbody>")
-    for record in records:
-        lines.append("      <tr>")
-        for h in headers:
-            value = record.get(h, "")
-            lines.append(f"        <td>{escape('' if value is None else str(value))}</td>")
-        lines.append("      </tr>")
-    lines.append("    </tbody>")
-    lines.append("  </table>")
-    lines.append("</body>")
-    lines.append("</html>")
 
-    _ensure_parent_dir(output_path)
-    with output_path.open("w", encoding="utf-8") as f:
+    row_template = "      <tr>\n" + "        <td>{}</td>\n" * len(headers) + "      </tr>\n"
+
+    with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
         f.write("\n".join(lines))
+        f.write("\n")
+        for record in records:
+            values = (record.get(h, "") for h in headers)
+            f.write(row_template.format(*(escape("" if v is None else str(v)) for v in values)))
+        f.write("    </tbody>\n  </table>\n</body>\n</html>")
 
     logger.info("HTML export completed: %s", output_path)
 
-def export_excel(records: List[Dict], output_path: Path) -> None:
+def export_excel(
+    records: List[Dict],
+    output_path: Path,
+    fieldnames: Optional[Sequence[str]] = None,
+) -> None:
     try:
         from openpyxl import Workbook
     except ImportError as exc:  # noqa: BLE001
@@ -109,20 +148,30 @@ def export_excel(records: List[Dict], output_path: Path) -> None:
         ) from exc
 
     _ensure_parent_dir(output_path)
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Profiles"
+    # Write-only workbooks stream rows to disk instead of keeping Cell objects.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Profiles")
 
-    fieldnames = _get_fieldnames(records) if records else []
+    if fieldnames is None:
+        fieldnames = _get_fieldnames(records) if records else []
     if fieldnames:
-        ws.append(fieldnames)
+        ws.append(tuple(fieldnames))
         for record in records:
-            ws.append([record.get(field, "") for field in fieldnames])
+            ws.append(tuple(record.get(field, "") for field in fieldnames))
 
     wb.save(output_path)
     logger.info("Excel export completed: %s", output_path)
 
-def export_profiles(records: List[Dict], output_path: Path, fmt: str) -> None:
+def export_profiles(
+    records: List[Dict],
+    output_path: Path,
+    fmt: str,
+    fieldnames: Optional[Sequence[str]] = None,
+) -> None:
+    """
+    Export records in the given format. `fieldnames` fixes the column order for
+    tabular formats; when omitted it is derived from the records.
+    """
     fmt_normalized = fmt.lower()
     path = Path(output_path)
 
@@ -132,15 +181,15 @@ def export_profiles(records: List[Dict], output_path: Path, fmt: str) -> None:
     if fmt_normalized == "json":
         export_json(records, path)
     elif fmt_normalized == "csv":
-        export_csv(records, path)
+        export_csv(records, path, fieldnames)
     elif fmt_normalized == "xml":
         export_xml(records, path)
     elif fmt_normalized == "html":
-        export_html(records, path)
+        export_html(records, path, fieldnames)
     elif fmt_normalized == "excel":
         # Ensure file has .xlsx extension for Excel
         if path.suffix.lower() != ".xlsx":
             path = path.with_suffix(".xlsx")
-        export_excel(records, path)
+        export_excel(records, path, fieldnames)
     else:
         raise ValueError(f"Unexpected export format '{fmt_normalized}'.")
\ No newline at end of file
@@ -5,7 +5,12 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from extractors.whatsapp_parser import build_profiles
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
+
+from extractors.whatsapp_parser import WHATSAPP_FIELDS, build_profiles, strip_number
 from outputs.exporters import export_profiles, SUPPORTED_FORMATS
 
 def load_settings(settings_path: Path) -> Dict[str, Any]:
@@ -23,8 +28,10 @@ def load_settings(settings_path: Path) -> Dict[str, Any]:
         return defaults
 
     try:
-        with settings_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(settings_path.read_bytes())
+        else:
+            data = json.loads(settings_path.read_text(encoding="utf-8"))
         if not isinstance(data, dict):
             logging.warning("Settings file %s does not contain a JSON object, using defaults.", settings_path)
             return defaults
@@ -44,21 +51,19 @@ def configure_logging(level_name: str) -> None:
         format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
     )
 
-def read_numbers_from_file(path: Path) -> List[str]:
+def read_numbers_from_file(path: Path) -> List[bytes]:
     """
-    Read phone numbers from a text file, one per line.
+    Read phone numbers from a text file, one per line, as raw bytes.
     Empty lines and comment lines starting with '#' are ignored.
     """
     if not path.is_file():
         raise FileNotFoundError(f"Input file not found: {path}")
 
-    numbers: List[str] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, line in enumerate(f, start=1):
-            raw = line.strip()
-            if not raw or raw.startswith("#"):
-                continue
-            numbers.append(raw)
+    numbers = [
+        line
+        for raw in path.read_bytes().splitlines()
+        if (line := strip_number(raw)) and not line.startswith(b"#")
+    ]
 
     if not numbers:
         raise ValueError(f"No valid phone numbers found in input file: {path}")
@@ -162,7 +167,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.info("Generated %d profiles.", len(profiles))
 
     try:
-        export_profiles(profiles, output_path, output_format)
+        export_profiles(profiles, output_path, output_format, fieldnames=WHATSAPP_FIELDS)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to export profiles: %s", exc)
         return 1
@@ -0,0 +1,18 @@
+import pytest
+
+from outputs import exporters
+
+def test_json_export_bytes_do_not_depend_on_orjson(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    records = [
+        {"number": "491234567890", "is_registered": True, "about": "✨ Hustle, in: silence ✨"},
+        {"number": "14155550123", "is_registered": False, "about": None},
+    ]
+
+    with_orjson = tmp_path / "orjson.json"
+    exporters.export_json(records, with_orjson)
+    monkeypatch.setattr(exporters, "orjson", None)
+    with_stdlib = tmp_path / "stdlib.json"
+    exporters.export_json(records, with_stdlib)
+
+    assert with_orjson.read_bytes() == with_stdlib.read_bytes()
@@ -0,0 +1,25 @@
+import pytest
+
+from extractors import whatsapp_parser
+
+def test_vectorized_profiles_match_scalar_profiles():
+    pytest.importorskip("numpy")
+    numbers = [str(n).encode("ascii") for n in range(491234567000, 491234569000)]
+    digests = whatsapp_parser._hash_numbers_batch(numbers)
+    texts = [number.decode("ascii") for number in numbers]
+    media_base = "https://cdn.example.com/whatsapp/avatars"
+    now = 1772366400
+
+    scalar = [
+        whatsapp_parser._build_profile(number, digest, media_base=media_base, now=now).to_dict()
+        for number, digest in zip(texts, digests)
+    ]
+    vectorized = whatsapp_parser._build_profiles_vectorized(texts, digests, media_base, now)
+
+    assert vectorized == scalar
+    assert all(tuple(profile) == whatsapp_parser.WHATSAPP_FIELDS for profile in vectorized)
+
+def test_validate_number_strips_unicode_whitespace():
+    assert whatsapp_parser._validate_number("\u00a0491234567890\u00a0".encode("utf-8")) == b"491234567890"
+    with pytest.raises(ValueError):
+        whatsapp_parser._validate_number("٤٩١٢٣٤٥٦٧".encode("utf-8"))